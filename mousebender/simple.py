@@ -1,6 +1,7 @@
-"""Parsing for PEP 503 -- Simple Repository API."""
+"""Parsing for PEP 503 -- Simple Repository API (and its PEP 691 JSON form)."""
 import html
 import html.parser
+import json
 import re
 import urllib.parse
 import warnings
@@ -14,6 +15,9 @@ _NORMALIZE_RE = re.compile(r"[-_.]+")
 
 PYPI_INDEX = "https://pypi.org/simple/"
 
+# The PEP 691 content type for the JSON serialization of v1 of the API.
+ACCEPT_JSON_V1 = "application/vnd.pypi.simple.v1+json"
+
 _SUPPORTED_VERSION = (1, 0)
 
 
@@ -61,19 +65,24 @@ def _normalize_project_url(url):
     return create_project_url(base_url, project_name)
 
 
-def _check_version(tag, attrs):
-    """Check if the tag is a PEP 629 tag and is a version that is supported."""
-    if tag != "meta" or attrs.get("name") != "pypi:repository-version":
+def _check_version(attrs):
+    """Check if a meta tag is a PEP 629 tag and is a version that is supported."""
+    if attrs.get("name") != "pypi:repository-version":
         return
 
-    major, minor = map(int, attrs["content"].split("."))
+    _check_api_version(attrs["content"])
+
+
+def _check_api_version(version):
+    """Check if a PEP 629 version string is a version that is supported."""
+    major, minor = map(int, version.split("."))
     if major != _SUPPORTED_VERSION[0]:
         msg = f"v{_SUPPORTED_VERSION[0]} supported, but v{major} used"
         raise UnsupportedVersion(msg)
     elif major == _SUPPORTED_VERSION[0] and minor > _SUPPORTED_VERSION[1]:
         msg = (
             f"v{_SUPPORTED_VERSION[0]}.{_SUPPORTED_VERSION[1]} supported, "
-            "but v{_SUPPORTED_VERSION[0]}.{minor_version} used"
+            f"but v{major}.{minor} used"
         )
         warnings.warn(msg, UnsupportedVersionWarning)
 
@@ -97,10 +106,14 @@ class _SimpleIndexHTMLParser(html.parser.HTMLParser):
         # PEP 503:
         # There may be any other HTML elements on the API pages as long as the
         # required anchor elements exist.
-        attrs = dict(attrs_list)
-        _check_version(tag, attrs)
-        if tag != "a":
+        # Only meta and anchor tags matter, so skip building an attribute dict
+        # for every other tag on the page.
+        if tag == "meta":
+            _check_version(dict(attrs_list))
+            return
+        elif tag != "a":
             return
+        attrs = dict(attrs_list)
         self._parsing_anchor = True
         self._url = attrs.get("href")
 
@@ -125,7 +138,23 @@ def parse_repo_index(html):
     return parser.mapping
 
 
-@attr.s(frozen=True)
+def parse_repo_index_json(data):
+    """Parse the JSON of a repository index page (PEP 691).
+
+    The data may be passed as the raw bytes of the response, skipping the need
+    to decode it to a str first.
+    """
+    index = json.loads(data)
+    _check_api_version(index["meta"]["api-version"])
+    # Project URLs are left out of the JSON response as they always follow the
+    # PEP 503 /<project>/ format relative to the index URL.
+    return {
+        project["name"]: create_project_url("", project["name"])
+        for project in index["projects"]
+    }
+
+
+@attr.s(frozen=True, slots=True)
 class ArchiveLink:
 
     """Data related to a link to an archive file."""
@@ -138,33 +167,55 @@ class ArchiveLink:
     yanked: Tuple[bool, str] = attr.ib(default=(False, ""))
 
 
+def _parse_requires_python(requires_python_data, cache):
+    """Parse a Requires-Python value, reusing any earlier parse from the page.
+
+    Most links on a page share a handful of Requires-Python values, so each
+    distinct value is only parsed once and the resulting SpecifierSet is shared
+    by every link with that value.
+    """
+    try:
+        return cache[requires_python_data]
+    except KeyError:
+        requires_python = packaging.specifiers.SpecifierSet(requires_python_data)
+        cache[requires_python_data] = requires_python
+        return requires_python
+
+
 class _ArchiveLinkHTMLParser(html.parser.HTMLParser):
     def __init__(self):
         self.archive_links = []
+        self._requires_python_cache = {}
         super().__init__()
 
     def handle_starttag(self, tag, attrs_list):
-        attrs = dict(attrs_list)
-        _check_version(tag, attrs)
-        if tag != "a":
+        if tag == "meta":
+            _check_version(dict(attrs_list))
             return
+        elif tag != "a":
+            return
+        attrs = dict(attrs_list)
         # PEP 503:
         # The href attribute MUST be a URL that links to the location of the
         # file for download ...
         full_url = attrs["href"]
-        parsed_url = urllib.parse.urlparse(full_url)
+        # Only the fragment and the final path component are needed, so split
+        # them off directly instead of fully parsing and re-assembling the URL.
+        url, _, fragment = full_url.partition("#")
         # PEP 503:
         # ... the text of the anchor tag MUST match the final path component
         # (the filename) of the URL.
-        _, _, raw_filename = parsed_url.path.rpartition("/")
+        path, _, _ = url.partition("?")
+        _, _, last_segment = path.rpartition("/")
+        # Like urlparse(), treat anything after a ";" as parameters.
+        raw_filename, _, _ = last_segment.partition(";")
         filename = urllib.parse.unquote(raw_filename)
-        url = urllib.parse.urlunparse((*parsed_url[:5], ""))
         hash_ = None
         # PEP 503:
         # The URL SHOULD include a hash in the form of a URL fragment with the
         # following syntax: #<hashname>=<hashvalue> ...
-        if parsed_url.fragment:
-            hash_algo, hash_value = parsed_url.fragment.split("=", 1)
+        if fragment:
+            hash_algo, hash_value = fragment.split("=", 1)
             hash_ = hash_algo.lower(), hash_value
         # PEP 503:
         # A repository MAY include a data-requires-python attribute on a file
@@ -172,7 +223,9 @@ class _ArchiveLinkHTMLParser(html.parser.HTMLParser):
         # In the attribute value, < and > have to be HTML encoded as &lt; and
         # &gt;, respectively.
         requires_python_data = html.unescape(attrs.get("data-requires-python", ""))
-        requires_python = packaging.specifiers.SpecifierSet(requires_python_data)
+        requires_python = _parse_requires_python(
+            requires_python_data, self._requires_python_cache
+        )
         # PEP 503:
         # A repository MAY include a data-gpg-sig attribute on a file link with
         # a value of either true or false ...
@@ -190,7 +243,64 @@ class _ArchiveLinkHTMLParser(html.parser.HTMLParser):
 
 
 def parse_archive_links(html):
-    """Parse the HTML of an archive links page."""
+    """Parse the HTML of an archive links page.
+
+    Links with the same Requires-Python value share the same SpecifierSet
+    object, so mutating one (e.g. setting ``prereleases``) affects them all.
+    """
     parser = _ArchiveLinkHTMLParser()
     parser.feed(html)
     return parser.archive_links
+
+
+def parse_archive_links_json(data):
+    """Parse the JSON of an archive links page (PEP 691).
+
+    The data may be passed as the raw bytes of the response, skipping the need
+    to decode it to a str first. As with parse_archive_links(), links with the
+    same Requires-Python value share the same SpecifierSet object.
+    """
+    details = json.loads(data)
+    # PEP 691:
+    # The api-version key MUST be present in the meta key ...
+    _check_api_version(details["meta"]["api-version"])
+    requires_python_cache = {}
+    archive_links = []
+    for file in details["files"]:
+        # PEP 691:
+        # hashes: A dictionary mapping a hash name to a hex encoded digest of
+        # the file. ... The hashes dictionary MUST be present, even if no
+        # hashes are available for the file ...
+        hashes = {name.lower(): value for name, value in file["hashes"].items()}
+        if "sha256" in hashes:
+            hash_ = "sha256", hashes["sha256"]
+        elif hashes:
+            hash_ = next(iter(hashes.items()))
+        else:
+            hash_ = None
+        requires_python = _parse_requires_python(
+            file.get("requires-python") or "", requires_python_cache
+        )
+        # PEP 691:
+        # yanked: An optional key which may be either a boolean to indicate if
+        # the file has been yanked, or a non empty, but otherwise arbitrary,
+        # string to indicate that a file has been yanked with a specific
+        # reason.
+        yanked = file.get("yanked", False)
+        if isinstance(yanked, str):
+            yanked = True, yanked
+        else:
+            yanked = yanked, ""
+
+        archive_links.append(
+            ArchiveLink(
+                file["filename"],
+                file["url"],
+                requires_python,
+                hash_,
+                file.get("gpg-sig"),
+                yanked,
+            )
+        )
+
+    return archive_links
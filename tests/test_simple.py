@@ -1,4 +1,5 @@
 """Tests for mousebender.simple."""
+import json
 import warnings
 
 import importlib_resources
@@ -103,6 +104,42 @@ class TestRepoIndexParsing:
         assert index["django-node"] == "django-node/"
 
 
+class TestRepoIndexJSONParsing:
+
+    """Tests for mousebender.simple.parse_repo_index_json()."""
+
+    def _example(self, *names, version="1.0"):
+        projects = [{"name": name} for name in names]
+        return json.dumps({"meta": {"api-version": version}, "projects": projects})
+
+    def test_empty(self):
+        index = simple.parse_repo_index_json(self._example())
+        assert not index
+
+    def test_project_url(self):
+        index = simple.parse_repo_index_json(self._example("numpy", "django-node"))
+        assert index == {"numpy": "numpy/", "django-node": "django-node/"}
+
+    def test_project_name_not_normalized(self):
+        index = simple.parse_repo_index_json(self._example("PACKAGE_NAME"))
+        assert index["PACKAGE_NAME"] == "package-name/"
+
+    def test_bytes(self):
+        data = self._example("numpy").encode("utf-8")
+        index = simple.parse_repo_index_json(data)
+        assert index == {"numpy": "numpy/"}
+
+    def test_newer_minor(self):
+        major, minor = simple._SUPPORTED_VERSION
+        with pytest.warns(simple.UnsupportedVersionWarning):
+            simple.parse_repo_index_json(self._example(version=f"{major}.{minor + 1}"))
+
+    def test_newer_major(self):
+        major, _ = simple._SUPPORTED_VERSION
+        with pytest.raises(simple.UnsupportedVersion):
+            simple.parse_repo_index_json(self._example(version=f"{major + 1}.0"))
+
+
 class TestParseArchiveLinks:
 
     """Tests for mousebender.simple.parse_archive_links()."""
@@ -197,6 +234,14 @@ class TestParseArchiveLinks:
                 '<a href="cpu/torch-1.2.0%2Bcpu-cp35-cp35m-win_amd64.whl">cpu/torch-1.2.0%2Bcpu-cp35-cp35m-win_amd64.whl</a><br>',
                 "torch-1.2.0+cpu-cp35-cp35m-win_amd64.whl",
             ),
+            (
+                '<a href="https://example.com/spam-1.2.3.tar.gz?download=1#sha256=abcdef">spam-1.2.3.tar.gz</a>',
+                "spam-1.2.3.tar.gz",
+            ),
+            (
+                '<a href="https://example.com/p/spam-1.2.3.tar.gz;x=1">spam-1.2.3.tar.gz</a>',
+                "spam-1.2.3.tar.gz",
+            ),
         ],
     )
     def test_filename(self, html, expected_filename):
@@ -215,6 +260,19 @@ class TestParseArchiveLinks:
                 '<a href="cpu/torch-1.2.0%2Bcpu-cp35-cp35m-win_amd64.whl">cpu/torch-1.2.0%2Bcpu-cp35-cp35m-win_amd64.whl</a><br>',
                 "cpu/torch-1.2.0%2Bcpu-cp35-cp35m-win_amd64.whl",
             ),
+            (
+                '<a href="https://example.com/spam-1.2.3.tar.gz?download=1#sha256=abcdef">spam-1.2.3.tar.gz</a>',
+                "https://example.com/spam-1.2.3.tar.gz?download=1",
+            ),
+            (
+                '<a href="https://example.com/p/spam-1.2.3.tar.gz;x=1">spam-1.2.3.tar.gz</a>',
+                "https://example.com/p/spam-1.2.3.tar.gz;x=1",
+            ),
+            # The URL is kept verbatim, including the case of the scheme.
+            (
+                '<a href="HTTPS://example.com/spam-1.2.3.tar.gz">spam-1.2.3.tar.gz</a>',
+                "HTTPS://example.com/spam-1.2.3.tar.gz",
+            ),
         ],
     )
     def test_url(self, html, expected_url):
@@ -247,6 +305,20 @@ class TestParseArchiveLinks:
                 not in archive_links[0].requires_python
             )
 
+    def test_requires_python_multiple_links(self):
+        html = """
+            <a href="spam-1.0.0-py3-none-any.whl" data-requires-python="&gt;=3.6">spam-1.0.0-py3-none-any.whl</a>
+            <a href="spam-1.1.0-py3-none-any.whl" data-requires-python="&gt;=3.7">spam-1.1.0-py3-none-any.whl</a>
+            <a href="spam-1.2.0-py3-none-any.whl" data-requires-python="&gt;=3.6">spam-1.2.0-py3-none-any.whl</a>
+        """
+        archive_links = simple.parse_archive_links(html)
+        assert len(archive_links) == 3
+        specifiers = [link.requires_python for link in archive_links]
+        assert specifiers[0] == packaging.specifiers.SpecifierSet(">=3.6")
+        assert specifiers[1] == packaging.specifiers.SpecifierSet(">=3.7")
+        # Equal values share a single parsed SpecifierSet.
+        assert specifiers[2] is specifiers[0]
+
     @pytest.mark.parametrize(
         "html,expected_hash",
         [
@@ -317,6 +389,112 @@ class TestParseArchiveLinks:
         assert archive_links[0].yanked == expected
 
 
+class TestParseArchiveLinksJSON:
+
+    """Tests for mousebender.simple.parse_archive_links_json()."""
+
+    def _example(self, **file_details):
+        file = {
+            "filename": "spam-1.2.3-py3-none-any.whl",
+            "url": "https://files.example.com/spam-1.2.3-py3-none-any.whl",
+            "hashes": {},
+        }
+        file.update(file_details)
+        return json.dumps(
+            {"meta": {"api-version": "1.0"}, "name": "spam", "files": [file]}
+        )
+
+    def test_full_parse(self):
+        data = self._example(
+            **{
+                "hashes": {"sha256": "abcdef"},
+                "requires-python": ">=3.6",
+                "gpg-sig": True,
+                "yanked": "oops!",
+            }
+        )
+        archive_links = simple.parse_archive_links_json(data)
+        assert archive_links == [
+            simple.ArchiveLink(
+                "spam-1.2.3-py3-none-any.whl",
+                "https://files.example.com/spam-1.2.3-py3-none-any.whl",
+                packaging.specifiers.SpecifierSet(">=3.6"),
+                ("sha256", "abcdef"),
+                True,
+                (True, "oops!"),
+            )
+        ]
+
+    def test_bytes(self):
+        data = self._example(**{"requires-python": ">=3.6"}).encode("utf-8")
+        archive_links = simple.parse_archive_links_json(data)
+        assert len(archive_links) == 1
+        assert archive_links[0].filename == "spam-1.2.3-py3-none-any.whl"
+
+    def test_no_files(self):
+        data = json.dumps({"meta": {"api-version": "1.0"}, "name": "spam", "files": []})
+        assert simple.parse_archive_links_json(data) == []
+
+    @pytest.mark.parametrize(
+        "hashes,expected_hash",
+        [
+            ({}, None),
+            ({"sha256": "abcdef"}, ("sha256", "abcdef")),
+            ({"md5": "123456", "sha256": "abcdef"}, ("sha256", "abcdef")),
+            ({"md5": "123456"}, ("md5", "123456")),
+            ({"SHA256": "abcdef"}, ("sha256", "abcdef")),
+            ({"MD5": "123456", "SHA256": "abcdef"}, ("sha256", "abcdef")),
+            ({"MD5": "123456"}, ("md5", "123456")),
+        ],
+    )
+    def test_hash_(self, hashes, expected_hash):
+        archive_links = simple.parse_archive_links_json(self._example(hashes=hashes))
+        assert archive_links[0].hash_ == expected_hash
+
+    @pytest.mark.parametrize("requires_python", [None, ""])
+    def test_no_requires_python(self, requires_python):
+        data = self._example(**{"requires-python": requires_python})
+        archive_links = simple.parse_archive_links_json(data)
+        assert archive_links[0].requires_python == packaging.specifiers.SpecifierSet()
+
+    @pytest.mark.parametrize(
+        "file_details,expected_gpg_sig",
+        [({}, None), ({"gpg-sig": True}, True), ({"gpg-sig": False}, False)],
+    )
+    def test_gpg_sig(self, file_details, expected_gpg_sig):
+        archive_links = simple.parse_archive_links_json(self._example(**file_details))
+        assert archive_links[0].gpg_sig == expected_gpg_sig
+
+    @pytest.mark.parametrize(
+        "file_details,expected",
+        [
+            ({}, (False, "")),
+            ({"yanked": False}, (False, "")),
+            ({"yanked": True}, (True, "")),
+            ({"yanked": "oops!"}, (True, "oops!")),
+        ],
+    )
+    def test_yanked(self, file_details, expected):
+        archive_links = simple.parse_archive_links_json(self._example(**file_details))
+        assert archive_links[0].yanked == expected
+
+    def test_newer_minor(self):
+        major, minor = simple._SUPPORTED_VERSION
+        data = json.dumps(
+            {"meta": {"api-version": f"{major}.{minor + 1}"}, "name": "", "files": []}
+        )
+        with pytest.warns(simple.UnsupportedVersionWarning):
+            simple.parse_archive_links_json(data)
+
+    def test_newer_major(self):
+        major, _ = simple._SUPPORTED_VERSION
+        data = json.dumps(
+            {"meta": {"api-version": f"{major + 1}.0"}, "name": "", "files": []}
+        )
+        with pytest.raises(simple.UnsupportedVersion):
+            simple.parse_archive_links_json(data)
+
+
 @pytest.mark.parametrize(
     "parser", [simple.parse_repo_index, simple.parse_archive_links]
 )
@@ -360,6 +538,8 @@ class TestPEP629Versioning:
 
             assert raised_warnings and len(raised_warnings) == 1
             assert raised_warnings[0].category is simple.UnsupportedVersionWarning
+            major, minor = simple._SUPPORTED_VERSION
+            assert f"v{major}.{minor + 1} used" in str(raised_warnings[0].message)
 
     def test_newer_major(self, parser):
         html = self._example(simple._SUPPORTED_VERSION[0] + 1, 0)